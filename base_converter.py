@@ -4,7 +4,8 @@
 
 import sys
 import argparse
-from decimal import Decimal, getcontext, ROUND_DOWN
+from functools import lru_cache, partial
+from decimal import Decimal, localcontext, ROUND_DOWN
 
 # Check if PyQt6 is available for GUI support
 try:
@@ -18,51 +19,147 @@ try:
 except ImportError:
     GUI_AVAILABLE = False
 
-def partition_quotient(dividend, divisor, minusone=False):
+# Digit characters indexed by digit value (0-35)
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Digit value for each accepted character (0-9, A-Z, a-z)
+_CHAR_DIGITS = {char: digit for digit, char in enumerate(_DIGITS)}
+_CHAR_DIGITS.update({char.lower(): digit for digit, char in enumerate(_DIGITS)})
+
+# bytes.translate table mapping digit values (0-35) to their ASCII characters
+_DIGIT_TRANS = _DIGITS.encode('ascii').ljust(256, b'\0')
+
+# Supported target bases, in display order
+_POSITIVE_BASES = tuple(range(2, 37))
+_ALL_BASES = tuple(range(-36, -1)) + _POSITIVE_BASES
+
+# Rule drawn around the per-base rows of the all-bases listing
+_SEPARATOR = '-' * 60
+
+# Bases with no valid positional representation
+_INVALID_BASES = frozenset({-1, 0, 1})
+
+# Characters accepted as digits, keyed by the magnitude of the base
+_VALID_CHARS = {base: frozenset(_DIGITS[:base] + _DIGITS[:base].lower())
+                for base in _POSITIVE_BASES}
+
+# Integers longer than this (in bits) are converted by divide-and-conquer
+_DC_THRESHOLD_BITS = 1024
+
+# Integers longer than this (in bits) are converted to all bases in parallel
+_PARALLEL_THRESHOLD_BITS = 16384
+
+# Digit blocks are looked up in a table of at most this many entries; a
+# bigger table saves little and costs more to build on first use of a base
+_BLOCK_TABLE_SIZE = 256
+
+# Integers up to this many bits are converted digit by digit, without tables
+_BLOCK_TABLE_MIN_BITS = 64
+
+def _word_chunk(base):
+    """
+    Build the digit tables for a positive base.
+    Returns (base**k, k // m, base**m, table) where base**k is the largest
+    word-sized power below 2**62 with k a multiple of the block width m,
+    and table[v] is v written as exactly m digits.
+    """
+    m = 1
+    while base ** (m + 1) <= _BLOCK_TABLE_SIZE:
+        m += 1
+    table = ['']
+    for _ in range(m):
+        table = [prefix + d for prefix in table for d in _DIGITS[:base]]
+    
+    blocks = 1
+    while base ** (m * (blocks + 1)) < 2 ** 62:
+        blocks += 1
+    return base ** (m * blocks), blocks, base ** m, table
+
+# Per-base chunk and digit-block tables, built on first use
+_CHUNK = {}
+
+# Per-base squared powers (base, base**2, base**4, ...) for divide-and-conquer
+_POWER_CACHE = {}
+
+def _get_powers(base, bits):
+    """
+    Return the cached squared powers of base, extended until the square of
+    the last entry exceeds every integer of the given bit length.
+    """
+    powers = _POWER_CACHE.get(base, (base,))
+    if 2 * powers[-1].bit_length() - 1 <= bits:
+        # Extend a private copy and publish it in one assignment, so threads
+        # sharing the cache never see (or append to) a half-built table
+        extended = list(powers)
+        while 2 * extended[-1].bit_length() - 1 <= bits:
+            extended.append(extended[-1] * extended[-1])
+        powers = _POWER_CACHE[base] = tuple(extended)
+    return powers
+
+# format() specs for the power-of-two bases CPython renders natively
+_POW2_FORMAT_SPECS = {2: 'b', 8: 'o', 16: 'X'}
+
+# Each hex digit expands to exactly two base-4 digits
+_HEX_TO_BASE4 = str.maketrans({c: _DIGITS[d // 4] + _DIGITS[d % 4]
+                               for d, c in enumerate('0123456789abcdef')})
+
+def partition_quotient(dividend, divisor):
     """
     Perform division ensuring non-negative remainders.
     Returns quotient and remainder where 0 <= remainder < |divisor|.
     """
-    if minusone and divisor > 0:
-        raise ValueError(f"minusone flag should only be used with negative bases, got base {divisor}")
-    elif minusone and dividend != -1:
-        raise ValueError(f"minusone flag should only be used with a dividend of -1, got dividend {dividend}")
-    
-    if not minusone:
-        quotient = dividend // divisor
-    else:
-        quotient = (-1 // divisor) + 1
-    remainder = dividend - (quotient * divisor)
-    while remainder < 0:
+    # divmod gives a remainder with the sign of the divisor, so a negative
+    # divisor needs at most one correction
+    quotient, remainder = divmod(dividend, divisor)
+    if remainder < 0:
         quotient += 1
-        remainder += abs(divisor)
+        remainder -= divisor
 
     return quotient, remainder
 
 def digit_to_char(digit):
     """Convert a digit (0-35) to its character representation (0-9, A-Z)"""
-    if digit < 10:
-        return str(digit)
-    else:
-        return chr(ord('A') + digit - 10)
+    return _DIGITS[digit]
 
 def char_to_digit(char):
     """Convert a character (0-9, A-Z, a-z) to its digit value (0-35)"""
-    if char.isdigit():
-        return int(char)
-    elif char.upper() in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-        return ord(char.upper()) - ord('A') + 10
-    else:
-        raise ValueError(f"Invalid character '{char}' in number")
+    try:
+        return _CHAR_DIGITS[char]
+    except KeyError:
+        raise ValueError(f"Invalid character '{char}' in number") from None
+
+def _check_digits(digits, base):
+    """Raise ValueError for the first character of digits that is not valid in base"""
+    abs_base = abs(base)
+    valid_chars = _VALID_CHARS.get(abs_base)
+    if valid_chars is None:
+        raise ValueError(validate_base(base))
+    if valid_chars.issuperset(digits):
+        return
+    for char in digits:
+        digit = char_to_digit(char)
+        if digit >= abs_base:
+            raise ValueError(f"Digit '{char}' (value {digit}) is invalid for base {base}")
+
+def _parse_positive_int(digits, base):
+    """
+    Parse a validated digit string in a positive base with the built-in int().
+    Long strings are parsed in pieces to stay under int()'s digit limit.
+    """
+    # The limit can change at runtime (or via PYTHONINTMAXSTRDIGITS); 0 means
+    # unlimited
+    chunk = sys.get_int_max_str_digits() or len(digits) or 1
+    value = 0
+    for start in range(0, len(digits), chunk):
+        piece = digits[start:start + chunk]
+        value = value * base ** len(piece) + int(piece, base)
+    return value
 
 def convert_from_base(number_str, base, precision=100):
     """
     Convert a number string from the specified base to base 10.
     Returns the base-10 Decimal value.
     """
-    # Set precision high enough for calculations
-    getcontext().prec = precision + 50
-    
     # Handle negative sign for positive bases
     is_negative = False
     if number_str.startswith('-'):
@@ -84,207 +181,410 @@ def convert_from_base(number_str, base, precision=100):
         int_part = number_str
         frac_part = ''
     
-    # Convert integer part
-    int_result = Decimal(0)
+    # Validate all digits up front so the loops below can index directly
+    _check_digits(int_part, base)
+    _check_digits(frac_part, base)
+    
+    # Convert integer part exactly as a Python int, then wrap it once
+    if base > 0:
+        int_value = _parse_positive_int(int_part, base)
+    else:
+        int_value = 0
+        for char in int_part:
+            int_value = int_value * base + _CHAR_DIGITS[char]
+    int_result = Decimal(int_value)
     base_decimal = Decimal(base)
     
-    for char in int_part:
-        digit = char_to_digit(char)
-        if digit >= abs(base):
-            raise ValueError(f"Digit '{char}' (value {digit}) is invalid for base {base}")
-        int_result = int_result * base_decimal + digit
+    # Use a local precision high enough for the calculations
+    with localcontext() as ctx:
+        ctx.prec = precision + 50
+        
+        # Convert fractional part
+        frac_result = Decimal(0)
+        if frac_part:
+            base_power = Decimal(1) / base_decimal
+            for char in frac_part:
+                frac_result += _CHAR_DIGITS[char] * base_power
+                base_power /= base_decimal
+        
+        result = int_result + frac_result
+        
+        if is_negative:
+            result = -result
     
-    # Convert fractional part
-    frac_result = Decimal(0)
-    if frac_part:
-        base_power = Decimal(1) / base_decimal
-        for char in frac_part:
-            digit = char_to_digit(char)
-            if digit >= abs(base):
-                raise ValueError(f"Digit '{char}' (value {digit}) is invalid for base {base}")
-            frac_result += digit * base_power
-            base_power /= base_decimal
+    return result
+
+def _to_positive_base(n, base):
+    """
+    Convert a non-negative integer n to a positive base.
+    Divides by a word-sized power of the base so that only one big-int
+    division is needed per chunk of digits, then emits each chunk as
+    fixed-width blocks from a lookup table.
+    Returns the digit string without leading zeros.
+    """
+    # Callers only pass integers of at most _DC_THRESHOLD_BITS bits, well
+    # within the int-to-str digit limit, so base 10 can use str() directly
+    if base == 10:
+        return str(n) if n else ''
     
-    result = int_result + frac_result
+    # Short integers are done digit by digit; building the block tables
+    # would cost more than it saves
+    if n.bit_length() <= _BLOCK_TABLE_MIN_BITS:
+        R = []
+        while n:
+            n, r = divmod(n, base)
+            R.append(_DIGITS[r])
+        return ''.join(reversed(R))
     
-    if is_negative:
-        result = -result
+    if base not in _CHUNK:
+        _CHUNK[base] = _word_chunk(base)
+    chunk, blocks, block, table = _CHUNK[base]
     
-    return result
+    R = []
+    while n >= chunk:
+        n, word = divmod(n, chunk)
+        for _ in range(blocks):
+            word, v = divmod(word, block)
+            R.append(table[v])
+    while n >= block:
+        n, v = divmod(n, block)
+        R.append(table[v])
+    if n:
+        R.append(table[n].lstrip('0'))
+    return ''.join(reversed(R))
+
+def _to_power_of_two_base(n, base):
+    """
+    Convert a positive integer n to base 2, 4, 8 or 16 using bit-level
+    formatting instead of division.
+    Returns the digit string without leading zeros.
+    """
+    if base == 4:
+        return format(n, 'x').translate(_HEX_TO_BASE4).lstrip('0')
+    return format(n, _POW2_FORMAT_SPECS[base])
+
+def _to_negative_base(n, base):
+    """
+    Convert an integer n to a negative base.
+    Returns the principal (non-negative digit) representation.
+    """
+    R = bytearray()
+    while n:
+        n, r = divmod(n, base)
+        if r < 0:
+            r -= base
+            n += 1
+        R.append(r)
+    R.reverse()
+    return R.translate(_DIGIT_TRANS).decode('ascii')
+
+def _convert_dc(n, base, power_table, depth):
+    """
+    Convert a non-negative integer n < power_table[depth]**2 to a positive base
+    by splitting it around power_table[depth] = base**(2**depth).
+    Returns the digit string without leading zeros.
+    """
+    if n.bit_length() <= _DC_THRESHOLD_BITS:
+        return _to_positive_base(n, base)
+    
+    hi, lo = divmod(n, power_table[depth])
+    lo_str = _convert_dc(lo, base, power_table, depth - 1)
+    if not hi:
+        return lo_str
+    hi_str = _convert_dc(hi, base, power_table, depth - 1)
+    return hi_str + lo_str.rjust(1 << depth, '0')
 
 def convert_integer_to_base(n, base):
     """
     Convert a base-10 integer n to the specified base.
     Returns the result string.
     """
-    if n == 0:
+    q = int(n)
+    if q == 0:
         return '0'
     
-    # Handle sign for positive bases
-    is_negative = n < 0
-    if base > 0 and is_negative:
-        n = abs(n)
+    # Negative bases represent every integer without a sign
+    if base < 0:
+        return _to_negative_base(q, base)
     
-    R = []
-    q = int(n)
-    while q != 0:
-        if q == -1:
-            q, r = partition_quotient(q, base, True)
-        else:
-            q, r = partition_quotient(q, base)
-        R.append(r)
-
-    out = ''
-    for digit in reversed(R):
-        out += digit_to_char(int(digit))
+    # Handle sign for positive bases
+    is_negative = q < 0
+    if is_negative:
+        q = -q
     
-    # Restore sign for positive bases
-    if base > 0 and is_negative:
-        out = '-' + out
+    if base in (2, 4, 8, 16):
+        out = _to_power_of_two_base(q, base)
+    elif q.bit_length() > _DC_THRESHOLD_BITS:
+        # Split around the smallest base**(2**k) whose square exceeds q
+        bits = q.bit_length()
+        power_table = _get_powers(base, bits)
+        depth = 0
+        while 2 * power_table[depth].bit_length() - 1 <= bits:
+            depth += 1
+        out = _convert_dc(q, base, power_table, depth)
+    else:
+        out = _to_positive_base(q, base)
     
-    return out if out else '0'
+    return '-' + out if is_negative else out
+
+def _decimal_coefficient(frac):
+    """Return (coeff, exp) with abs(frac) == coeff * 10**exp; the sign is ignored"""
+    sign, digits, exp = frac.as_tuple()
+    return int(Decimal((0, digits, 0))), exp
 
-def convert_fraction_to_base(frac, base, precision):
+def convert_fraction_to_base(frac, base, precision, max_digits=None):
     """
     Convert a fractional part (0 <= frac < 1) to the specified base.
+    At most max_digits digits are produced (default: precision).
     Returns the fractional digits as a string (without leading '0.').
+    Raises ValueError if frac rounds up to 1 at this precision, since the
+    carry has no place in the fractional digits; convert_to_base carries it
+    into the integer part instead.
     """
     if frac == 0:
         return ''
     
-    getcontext().prec = precision + 50
+    digits, carry = _fraction_to_base(*_decimal_coefficient(frac), base, precision, max_digits)
+    if carry:
+        raise ValueError(f"Fraction {frac} rounds up to 1 at precision {precision}")
+    return digits
+
+def _fraction_to_base(coeff, exp, base, precision, max_digits=None):
+    """
+    Convert the fraction coeff * 10**exp (0 < value < 1) to the specified base.
+    Returns (digits, carry): the fractional digits as a string (without
+    leading '0.'), and whether rounding carried a whole unit out of the
+    fraction, in which case digits is empty.
+    """
+    # Reproduce, with plain integers, the Decimal arithmetic of a context
+    # holding precision + 50 digits: each multiply by the base is rounded
+    # half-even to that many digits, which lets rounded repeating inputs
+    # such as 0.333... settle on 0.C in base 36
+    limit = 10 ** (precision + 50)
+    abs_base = abs(base)
+    
+    def advance(coeff, exp, scale):
+        """Produce the next digit; returns (digit, coeff, exp, scale)"""
+        coeff *= abs_base
+        if coeff >= limit:
+            # Drop the extra digits: the multiply adds one or two, but a
+            # starting coefficient longer than the context can carry more,
+            # and Decimal rounds those away only after the first multiply
+            if coeff < 10 * limit:
+                excess = 1
+            elif coeff < 100 * limit:
+                excess = 2
+            else:
+                excess_value = coeff // limit
+                excess = int((excess_value.bit_length() - 1) * 0.30103)
+                while 10 ** excess <= excess_value:
+                    excess += 1
+            unit = 10 ** excess
+            coeff, rem = divmod(coeff, unit)
+            if rem > unit // 2 or (rem == unit // 2 and coeff & 1):
+                coeff += 1
+            exp += excess
+            if coeff == limit:
+                coeff //= 10
+                exp += 1
+            scale = 10 ** -exp if exp < 0 else 1
+        
+        if exp >= 0:
+            return coeff * 10 ** exp, 0, exp, scale
+        digit, coeff = divmod(coeff, scale)
+        return digit, coeff, exp, scale
+    
+    start = (coeff, exp, 10 ** -exp)
+    state = start
+    result = []
+    append = result.append
     
-    result = ''
+    # States can hold precision + 50 digits each, so only their hashes are
+    # kept; a hash match is confirmed by replaying the digits from the start
     seen_states = {}
-    base_decimal = Decimal(abs(base))
     
-    # For negative bases, fractional conversion is more complex
-    if base < 0:
-        for i in range(precision):
-            frac *= base_decimal
-            digit = int(frac)
-            frac -= digit
-            
-            # Normalize to ensure proper representation
-            while frac < 0:
-                digit -= 1
-                frac += 1
-            while frac >= 1:
-                digit += 1
-                frac -= 1
-            
-            if digit < 0 or digit >= abs(base):
-                break
-            
-            result += digit_to_char(digit)
-            
-            if frac == 0:
-                break
-            
-            # Check for repeating pattern
-            state = str(frac)
-            if state in seen_states:
-                repeat_start = seen_states[state]
-                non_repeat = result[:repeat_start]
-                repeat = result[repeat_start:]
-                return f"{non_repeat}({repeat})"
-            seen_states[state] = len(result)
+    for i in range(precision if max_digits is None else max_digits):
+        digit, *state = advance(*state)
+        coeff, exp, scale = state
+        
+        # Rounding can push the product up to the base itself; carry into the
+        # earlier digits when that stays within the fraction
+        if digit >= abs_base:
+            keep = len(result)
+            while keep and result[keep - 1] == _DIGITS[abs_base - 1]:
+                keep -= 1
+            if not keep:
+                # Every digit so far rolls over: the fraction rounds up to 1
+                return '', True
+            result[keep - 1:] = [_DIGITS[_CHAR_DIGITS[result[keep - 1]] + 1]]
+            break
+        
+        append(_DIGITS[digit])
+        
+        if coeff == 0:
+            break
+        
+        # Check for repeating pattern
+        key = hash((coeff, exp))
+        for repeat_start in seen_states.get(key, ()):
+            earlier = start
+            for _ in range(repeat_start):
+                earlier = advance(*earlier)[1:]
+            if earlier[:2] == (coeff, exp):
+                non_repeat = ''.join(result[:repeat_start])
+                repeat = ''.join(result[repeat_start:])
+                return f"{non_repeat}({repeat})", False
+        seen_states.setdefault(key, []).append(len(result))
+    
+    return ''.join(result), False
+
+def _convert_to_base_split(int_part, frac_coeff, frac_exp, is_negative, base, precision, max_digits=None):
+    """
+    Convert a number already split into its truncated integer part and the
+    magnitude of its fractional part, frac_coeff * 10**frac_exp, to the
+    specified base.
+    Returns the result string.
+    """
+    # Convert fractional part first, since rounding it can carry into the
+    # integer part
+    frac_str = ''
+    if frac_coeff:
+        frac_str, carry = _fraction_to_base(frac_coeff, frac_exp, base, precision, max_digits)
+        if carry:
+            int_part += -1 if is_negative else 1
+    
+    if base > 0:
+        int_str = convert_integer_to_base(abs(int_part), base)
     else:
-        # Standard algorithm for positive bases
-        for i in range(precision):
-            frac *= base_decimal
-            digit = int(frac)
-            frac -= digit
-            result += digit_to_char(digit)
-            
-            if frac == 0:
-                break
-            
-            # Check for repeating pattern
-            state = str(frac)
-            if state in seen_states:
-                repeat_start = seen_states[state]
-                non_repeat = result[:repeat_start]
-                repeat = result[repeat_start:]
-                return f"{non_repeat}({repeat})"
-            seen_states[state] = len(result)
+        # Negative bases represent the signed integer part directly
+        int_str = convert_integer_to_base(int_part, base)
+    
+    result = f"{int_str}.{frac_str}" if frac_str else int_str
+    
+    # Restore sign for positive bases
+    if base > 0 and is_negative:
+        result = '-' + result
     
     return result
 
+def _split_decimal(n):
+    """
+    Split a Decimal into (int_part, frac_coeff, frac_exp, is_negative), where
+    int_part is truncated toward zero and frac_coeff * 10**frac_exp is the
+    non-negative fractional magnitude.
+    """
+    # Truncate in Decimal so the subtraction needs no int -> Decimal rebuild
+    int_part = n.to_integral_value(rounding=ROUND_DOWN)
+    return (int(int_part), *_decimal_coefficient(n - int_part), n < 0)
+
 def convert_to_base(n, base, precision=50):
     """
     Convert a base-10 number (integer or Decimal) to the specified base.
     Returns the result string.
     """
-    getcontext().prec = precision + 50
+    # Whole numbers need no Decimal split or fractional conversion
+    if isinstance(n, int):
+        return convert_integer_to_base(n, base)
     
     if not isinstance(n, Decimal):
         n = Decimal(str(n))
     
-    # Handle sign for positive bases
-    is_negative = n < 0
-    if base > 0 and is_negative:
-        n = abs(n)
+    if n == n.to_integral_value():
+        return convert_integer_to_base(int(n), base)
     
-    # Separate integer and fractional parts
-    int_part = int(n)
-    frac_part = n - int_part
+    with localcontext() as ctx:
+        ctx.prec = precision + 50
+        parts = _split_decimal(n)
     
-    # Handle negative base with negative number
-    if base < 0 and is_negative:
-        int_str = convert_integer_to_base(int_part, base)
-        if frac_part != 0:
-            frac_str = convert_fraction_to_base(abs(frac_part), base, precision)
-            if frac_str:
-                return f"{int_str}.{frac_str}"
-        return int_str
-    
-    # Convert integer part
-    int_str = convert_integer_to_base(int_part, base)
-    
-    # Convert fractional part
-    if frac_part != 0:
-        frac_str = convert_fraction_to_base(frac_part, base, precision)
-        if frac_str:
-            result = f"{int_str}.{frac_str}"
-        else:
-            result = int_str
+    return _convert_to_base_split(*parts, base, precision)
+
+@lru_cache(maxsize=512)
+def _convert_to_base_cached(base10_key, base, precision):
+    """Memoized convert_to_base, keyed by the string form of the base-10 value"""
+    return convert_to_base(Decimal(base10_key), base, precision)
+
+@lru_cache(maxsize=32)
+def _all_bases_rows(base10_key, positive_only, precision, parallel=False):
+    """
+    Build the per-base rows of convert_all_bases, memoized so repeated sweeps
+    of the same value (e.g. from the GUI) skip the conversions.
+    base10_key is the value itself for ints and its string form otherwise.
+    With parallel=True, huge integers are converted in a process pool.
+    """
+    bases_to_try = _POSITIVE_BASES if positive_only else _ALL_BASES
+    
+    # Whole numbers go straight to the integer converter for every base,
+    # skipping the Decimal split and fractional conversion
+    int_value = None
+    if isinstance(base10_key, int):
+        int_value = base10_key
     else:
-        result = int_str
+        base10_number = Decimal(base10_key)
+        if base10_number == base10_number.to_integral_value():
+            int_value = int(base10_number)
     
-    # Restore sign for positive bases
-    if base > 0 and is_negative:
-        if not result.startswith('-'):
-            result = '-' + result
+    if int_value is not None:
+        convert = partial(convert_integer_to_base, int_value)
+        use_pool = parallel and abs(int_value).bit_length() > _PARALLEL_THRESHOLD_BITS
+    else:
+        # Split once here rather than once per base
+        with localcontext() as ctx:
+            ctx.prec = precision + 50
+            parts = _split_decimal(base10_number)
+        # Results are cut to 50 characters for display, so no more than 50
+        # fractional digits are ever shown
+        convert = partial(_convert_to_base_split, *parts, precision=precision,
+                          max_digits=min(precision, 50))
+        use_pool = False
     
-    return result
+    converted = None
+    # Each base is independent, so huge inputs are spread across processes
+    if use_pool:
+        # Imported here: multiprocessing roughly doubles the module's import
+        # time, and only huge integers ever take this branch
+        from concurrent.futures import ProcessPoolExecutor
+        try:
+            with ProcessPoolExecutor() as executor:
+                converted = list(executor.map(convert, bases_to_try, chunksize=8))
+        except RuntimeError:
+            # Includes BrokenProcessPool, e.g. when spawned workers re-import
+            # a caller without an if __name__ == "__main__" guard
+            pass
+    if converted is None:
+        converted = map(convert, bases_to_try)
+    
+    # Truncate very long results for display
+    return tuple(f'Number in base {base:3}: \t{result[:47] + "..." if len(result) > 50 else result}'
+                 for base, result in zip(bases_to_try, converted))
 
-def convert_all_bases(original_number_str, from_base, base10_number, positive_only=False, precision=50):
-    """Convert to all available bases and display results"""
+def convert_all_bases(original_number_str, from_base, base10_number, positive_only=False, precision=50,
+                      parallel=False):
+    """
+    Convert to all available bases and display results.
+    With parallel=True, integers over _PARALLEL_THRESHOLD_BITS bits are
+    converted in a process pool; only enable it from a script guarded by
+    if __name__ == "__main__".
+    """
     results = []
     
     # Show original number if from_base is not 10
     if from_base != 10:
         results.append(f'Number in base {from_base}: \t{original_number_str}')
     
-    results.append(f'Number in base 10: \t{base10_number}\n')
-    results.append('-' * 60)
-    
-    if positive_only:
-        bases_to_try = range(2, 37)
+    # str() of a huge int would hit the int-to-str digit limit, so ints are
+    # written with the integer converter and passed to the cache as they are
+    if isinstance(base10_number, int):
+        base10_key = base10_number
+        base10_str = convert_integer_to_base(base10_number, 10)
     else:
-        bases_to_try = list(range(-36, -1)) + list(range(2, 37))
-    
-    for base in bases_to_try:
-        result = convert_to_base(base10_number, base, precision)
-        # Truncate very long results for display
-        if len(result) > 50:
-            display_result = result[:47] + "..."
-        else:
-            display_result = result
-        results.append(f'Number in base {base:3}: \t{display_result}')
-    
-    results.append('-' * 60)
+        base10_key = base10_str = str(base10_number)
+    
+    results.append(f'Number in base 10: \t{base10_str}\n')
+    results.append(_SEPARATOR)
+    
+    results.extend(_all_bases_rows(base10_key, positive_only, precision, parallel))
+    
+    results.append(_SEPARATOR)
     return '\n'.join(results)
 
 def validate_base(base):
@@ -464,7 +764,7 @@ if GUI_AVAILABLE:
             """Validate the typed value after typing stops"""
             self._typing = False
             value = self.value()
-            if value in [-1, 0, 1]:
+            if value in _INVALID_BASES:
                 # Jump to nearest valid value
                 if value == 0:
                     self.setValue(2)
@@ -479,7 +779,7 @@ if GUI_AVAILABLE:
             new_value = current + steps
             
             # Skip invalid values
-            if new_value in [-1, 0, 1]:
+            if new_value in _INVALID_BASES:
                 if steps > 0:
                     if new_value == -1:
                         new_value = 2
@@ -790,9 +1090,6 @@ if GUI_AVAILABLE:
                     if error:
                         raise ValueError(f"Invalid to-base: {error}")
                 
-                # Set global precision
-                getcontext().prec = precision + 100
-                
                 # Convert to base 10
                 base10_number = convert_from_base(number_str, from_base, precision)
                 
@@ -804,7 +1101,11 @@ if GUI_AVAILABLE:
                     output = convert_all_bases(number_str, from_base, base10_number, 
                                               positive_only=True, precision=precision)
                 else:
-                    result = convert_to_base(base10_number, to_base, precision)
+                    # Only long inputs or high precision are worth a cache slot
+                    if precision > 100 or len(number_str) > 20:
+                        result = _convert_to_base_cached(str(base10_number), to_base, precision)
+                    else:
+                        result = convert_to_base(base10_number, to_base, precision)
                     output = f'Number in base {from_base}: \t{number_str}\n'
                     output += f'Number in base 10: \t{base10_number}\n'
                     output += f'Number in base {to_base}: \t{result}'
@@ -818,8 +1119,9 @@ if GUI_AVAILABLE:
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"An unexpected error occurred: {str(e)}")
 
-def parse_args():
-    """Parse command line arguments using argparse."""
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command line parser once and reuse it for later calls."""
     # Create centered header
     header = """
               ------------------------------
@@ -900,6 +1202,11 @@ Notes:
         help='Display conversions to all positive bases (2 to 36)'
     )
     
+    return parser
+
+def parse_args():
+    """Parse command line arguments using argparse."""
+    parser = _build_parser()
     args = parser.parse_args()
     
     # Check if GUI is requested
@@ -941,9 +1248,6 @@ if __name__ == "__main__":
         sys.exit(app.exec())
     
     # Otherwise, run command-line version
-    # Set global precision
-    getcontext().prec = args.precision + 100
-    
     # Convert from source base to base 10
     try:
         base10_number = convert_from_base(args.number, args.from_base, args.precision)
@@ -953,14 +1257,14 @@ if __name__ == "__main__":
     
     if args.all:
         output = convert_all_bases(args.number, args.from_base, base10_number, 
-                                   positive_only=False, precision=args.precision)
+                                   positive_only=False, precision=args.precision, parallel=True)
         print(output)
     elif args.allpos:
         output = convert_all_bases(args.number, args.from_base, base10_number, 
-                                   positive_only=True, precision=args.precision)
+                                   positive_only=True, precision=args.precision, parallel=True)
         print(output)
     else:
         result = convert_to_base(base10_number, args.to_base, args.precision)
-        print(f'\nNumber in base {args.from_base}: \t{args.number}')
-        print(f'Number in base 10: \t{base10_number}')
-        print(f'Number in base {args.to_base}: \t{result}\n')
\ No newline at end of file
+        sys.stdout.write(f'\nNumber in base {args.from_base}: \t{args.number}\n'
+                         f'Number in base 10: \t{base10_number}\n'
+                         f'Number in base {args.to_base}: \t{result}\n\n')
\ No newline at end of file